@@ -1,12 +1,19 @@
 # Databricks notebook to setup the MDLH catalog
 # MAGIC %pip install pyiceberg
 import os
+import json
 import logging
 import sys
-from typing import List, Tuple
-from pyiceberg.catalog import load_catalog
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from pyiceberg.catalog import Catalog, load_catalog
+from pyiceberg.exceptions import NoSuchNamespaceError
 from pyiceberg.table import TableIdentifier
 from pyspark.sql import SparkSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # -----------------------------
 # Logging
@@ -35,60 +42,196 @@ DBX_CATALOG_NAME = os.getenv("DBX_CATALOG_NAME", "<target-dbx-catalog-name>")
 # default is Skipping atlan-history. please set to true to enable history tables sync
 HISTORY_NAMESPACE_SYNC = os.getenv("HISTORY_NAMESPACE_SYNC", "false").lower() == "true"
 
+# Number of concurrent Polaris table loads, and of concurrent CREATE TABLE
+# batches against Unity Catalog. Both are I/O-bound
+MAX_CONCURRENT_TABLES = int(os.getenv("MDLH_MAX_CONCURRENT_TABLES", "32"))
+
+# Number of namespaces whose schema is created and tables listed concurrently
+MAX_CONCURRENT_NAMESPACES = int(os.getenv("MDLH_MAX_CONCURRENT_NAMESPACES", "16"))
+
+# Number of CREATE TABLE statements submitted to Unity Catalog per round-trip.
+# Batches run as one SQL scripting block; set to 1 to issue them one at a time
+DDL_BATCH_SIZE = int(os.getenv("MDLH_DDL_BATCH_SIZE", "50"))
+
+# Tables requested per Polaris list_tables page; each page is loaded and
+# created while the next one is fetched. Only namespaces that fit in one page
+# can reuse their cached listing (see NAMESPACE_CACHE_PATH)
+LIST_TABLES_PAGE_SIZE = max(int(os.getenv("MDLH_LIST_TABLES_PAGE_SIZE", "100")), 1)
+
+# Opt-in: sync with CREATE OR REPLACE TABLE instead of CREATE TABLE IF NOT
+# EXISTS, so existing tables are repointed to the current metadata path.
+# Tables whose path hasn't moved since they were last replaced are skipped
+REPLACE_ON_SYNC = os.getenv("MDLH_REPLACE_ON_SYNC", "false").lower() == "true"
+REPLACE_STATE_PATH = os.getenv("MDLH_REPLACE_STATE_PATH", "/dbfs/tmp/mdlh_replace_state.json")
+
+# State file of the refresh script (same setting as there). Entries for tables
+# this run created or replaced are dropped, so the next refresh doesn't skip
+# them as unchanged
+REFRESH_STATE_PATH = os.getenv("MDLH_REFRESH_STATE_PATH", "/dbfs/tmp/mdlh_refresh_state.json")
+
+# Local cache of each namespace's table listing and its ETag. When Polaris
+# answers a conditional listing with 304 Not Modified, the cached listing is
+# reused. Only single-page listings (at most LIST_TABLES_PAGE_SIZE tables) are
+# cached. Set to "" to disable
+NAMESPACE_CACHE_PATH = os.getenv("MDLH_NAMESPACE_CACHE_PATH", "/dbfs/tmp/mdlh_ns_fingerprints.json")
+
 # COMMAND ----------
 
 # Databricks notebook source
 # -----------------------------
 # Polaris SQL Reader
 # -----------------------------
+_CATALOG: Optional[Catalog] = None
+_CATALOG_NAMES: Optional[Tuple[str, str]] = None
+_CATALOG_LOCK = threading.Lock()
+
+def is_configured(value: str) -> bool:
+    """True when a config value was set, i.e. is not a <placeholder>."""
+    return bool(value) and not value.startswith("<")
+
+def load_polaris_catalog(catalog_name: str, warehouse_name: str) -> Catalog:
+    return load_catalog(
+        catalog_name,
+        uri=POLARIS_CATALOG_URI,
+        warehouse=warehouse_name,
+        credential=f"{CLIENT_ID}:{CLIENT_SECRET}",
+        scope="PRINCIPAL_ROLE:ALL"
+    )
+
+def widen_http_pool(catalog: Catalog):
+    """
+    Size the REST catalog's HTTP connection pool for the worker pools.
+    requests keeps only 10 connections per host by default, so parallel
+    load_table calls would queue for a connection instead of on Polaris.
+    Namespace listings and table loads run at the same time, so the pool
+    holds one connection per worker of both pools.
+    Transient throttling/gateway errors on idempotent calls are retried; once
+    retries run out the last response is returned (raise_on_status=False), so
+    pyiceberg's and list_tables' status handling still sees it.
+    """
+    session = getattr(catalog, "_session", None)
+    if session is None:
+        return
+    pool_size = MAX_CONCURRENT_TABLES + MAX_CONCURRENT_NAMESPACES
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 502, 503, 504],
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+def detect_catalog() -> Tuple[str, Catalog]:
+    """
+    Detect catalog and warehouse dynamically.
+    Prefer 'atlan-wh', fallback to 'context_store'.
+    Returns the probed catalog so it doesn't have to be loaded twice.
+    """
+    logger.info("Detecting Polaris catalog...")
+
+    errors = {}
+    for candidate in ["atlan-wh", "context_store"]:
+        try:
+            test_catalog = load_polaris_catalog(candidate, candidate)
+            namespaces = test_catalog.list_namespaces()
+            if namespaces:
+                logger.info(f"Using catalog: {candidate}")
+                return candidate, test_catalog
+        except Exception as e:
+            errors[candidate] = e
+            logger.info(f"Catalog not accessible: {candidate}")
+
+    logger.error(
+        "No valid Polaris catalog found. Errors per candidate: "
+        + "; ".join(f"{name}: {err!r}" for name, err in errors.items())
+    )
+    raise RuntimeError("No valid Polaris catalog found")
+
+def get_catalog() -> Tuple[Catalog, str, str]:
+    """
+    Return the notebook-wide Polaris catalog with its catalog and warehouse
+    names, connecting on first use. Safe to call from worker threads.
+    When CATALOG_NAME is configured, detection (and its probe round-trip)
+    is skipped; WAREHOUSE_NAME defaults to the catalog name.
+    """
+    global _CATALOG, _CATALOG_NAMES
+    with _CATALOG_LOCK:
+        if _CATALOG is None:
+            if is_configured(CATALOG_NAME):
+                warehouse_name = WAREHOUSE_NAME if is_configured(WAREHOUSE_NAME) else CATALOG_NAME
+                _CATALOG = load_polaris_catalog(CATALOG_NAME, warehouse_name)
+                _CATALOG_NAMES = (CATALOG_NAME, warehouse_name)
+            else:
+                catalog_name, _CATALOG = detect_catalog()
+                _CATALOG_NAMES = (catalog_name, catalog_name)
+            widen_http_pool(_CATALOG)
+            logger.info(f"Connected to Polaris catalog: {_CATALOG_NAMES[0]}")
+        return _CATALOG, _CATALOG_NAMES[0], _CATALOG_NAMES[1]
+
+def read_json_cache(path: str, label: str) -> Dict:
+    """
+    Read a JSON cache written by a previous run.
+    A missing, disabled or unreadable cache is treated as empty.
+    """
+    if not path:
+        return {}
+    try:
+        with open(path) as f:
+            cache = json.load(f)
+        logger.info(f"Loaded {len(cache)} entries from {label}")
+        return cache
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable {label} {path}: {e}")
+        return {}
+
+def write_json_cache(path: str, label: str, cache: Dict):
+    if not path:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(cache, f)
+        logger.info(f"Saved {len(cache)} entries to {label} {path}")
+    except Exception as e:
+        logger.warning(f"Could not save {label} {path}: {e}")
+
+def listing_body(response) -> Optional[Dict]:
+    """The JSON body of a successful table listing, or None if it isn't one."""
+    if response.status_code != 200:
+        return None
+    try:
+        body = response.json()
+    except ValueError:
+        return None
+    if not isinstance(body, dict) or not isinstance(body.get("identifiers"), list):
+        return None
+    return body
+
 class PolarisSQLReader:
     def __init__(self):
         self.catalog = None
         self.catalog_name = None
         self.warehouse_name = None
-
-    def detect_catalog(self) -> Tuple[str, str]:
-        """
-        Detect catalog and warehouse dynamically.
-        Prefer 'atlan-wh', fallback to 'context_store'.
-        """
-        logger.info("Detecting Polaris catalog...")
-
-        errors = {}
-        for candidate in ["atlan-wh", "context_store"]:
-            try:
-                test_catalog = load_catalog(
-                    candidate,
-                    uri=POLARIS_CATALOG_URI,
-                    warehouse=candidate,
-                    credential=f"{CLIENT_ID}:{CLIENT_SECRET}",
-                    scope="PRINCIPAL_ROLE:ALL"
-                )
-                namespaces = test_catalog.list_namespaces()
-                if namespaces:
-                    logger.info(f"Using catalog: {candidate}")
-                    return candidate, candidate
-            except Exception as e:
-                errors[candidate] = e
-                logger.info(f"Catalog not accessible: {candidate}")
-
-        logger.error(
-            "No valid Polaris catalog found. Errors per candidate: "
-            + "; ".join(f"{name}: {err!r}" for name, err in errors.items())
-        )
-        raise RuntimeError("No valid Polaris catalog found")
+        self.namespace_cache = read_json_cache(NAMESPACE_CACHE_PATH, "namespace cache")
+        self._namespace_cache_lock = threading.Lock()
+        self._token_lock = threading.Lock()
+        # Unity Catalog table -> metadata path it was last replaced to
+        self.replace_state = read_json_cache(REPLACE_STATE_PATH, "replace state") if REPLACE_ON_SYNC else {}
+        self._replace_state_lock = threading.Lock()
+        # Unity Catalog tables this run pointed at a new metadata path
+        self.repointed = set()
+        self._repointed_lock = threading.Lock()
 
     def connect_to_catalog(self):
         if not self.catalog:
-            self.catalog_name, self.warehouse_name = self.detect_catalog()
-            self.catalog = load_catalog(
-                self.catalog_name,
-                uri=POLARIS_CATALOG_URI,
-                warehouse=self.warehouse_name,
-                credential=f"{CLIENT_ID}:{CLIENT_SECRET}",
-                scope="PRINCIPAL_ROLE:ALL"
-            )
-            logger.info(f"Connected to Polaris catalog: {self.catalog_name}")
+            self.catalog, self.catalog_name, self.warehouse_name = get_catalog()
 
     def list_namespaces(self) -> List[str]:
         self.connect_to_catalog()
@@ -96,9 +239,141 @@ class PolarisSQLReader:
         logger.info(f"Found {len(namespaces)} namespaces: {namespaces}")
         return [ns[0] if isinstance(ns, tuple) else ns for ns in namespaces]
 
-    def list_tables(self, namespace: str) -> List[TableIdentifier]:
+    def list_tables(self, namespace: str) -> Iterator[TableIdentifier]:
+        """
+        Yield a namespace's tables as the REST catalog returns them, one
+        page at a time, so callers can start work before the listing ends.
+        Servers that don't paginate return everything in the first page.
+
+        This calls the REST endpoint through pyiceberg internals
+        (catalog._session, catalog.url, catalog._refresh_token), which ties
+        the notebook to pyiceberg's REST client. Non-REST catalogs, and any
+        response not handled here, go through catalog.list_tables instead.
+        """
         self.connect_to_catalog()
-        return self.catalog.list_tables(namespace)
+        session = getattr(self.catalog, "_session", None)
+        if session is None or not hasattr(self.catalog, "url"):
+            yield from self.catalog.list_tables(namespace)
+            return
+
+        url = self.catalog.url("namespaces/{namespace}/tables", namespace=namespace)
+        with self._namespace_cache_lock:
+            cached = self.namespace_cache.get(namespace)
+        # Conditional request: unchanged listings come back as 304 with no body
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+        # An empty pageToken opts in to pagination (Iceberg REST spec)
+        params = {"pageToken": "", "pageSize": LIST_TABLES_PAGE_SIZE}
+        yielded = set()
+        token_refreshed = False
+        while True:
+            response = session.get(url, params=params, headers=headers)
+            if response.status_code in (401, 419) and not token_refreshed and self.refresh_token():
+                # Token expired mid-sync: retry once with a fresh one, as
+                # pyiceberg's own calls do
+                token_refreshed = True
+                continue
+            if response.status_code == 304 and cached:
+                logger.info(f"Table listing for {namespace} unchanged since last run")
+                yield from (tuple(identifier) for identifier in cached["tables"])
+                return
+            if response.status_code == 404:
+                raise NoSuchNamespaceError(f"Namespace does not exist: {namespace}")
+            body = listing_body(response)
+            if body is None:
+                logger.info(
+                    f"Unexpected table listing response for {namespace} "
+                    f"(HTTP {response.status_code}), falling back to catalog.list_tables"
+                )
+                with self._namespace_cache_lock:
+                    self.namespace_cache.pop(namespace, None)
+                yield from (
+                    identifier for identifier in self.catalog.list_tables(namespace)
+                    if tuple(identifier) not in yielded
+                )
+                return
+            headers = {}
+            token_refreshed = False
+            page = [
+                (*identifier["namespace"], identifier["name"])
+                for identifier in body["identifiers"]
+            ]
+            yield from page
+            yielded.update(page)
+            next_token = body.get("next-page-token")
+            if not next_token:
+                # Only single-page listings are cached: the ETag of the first
+                # page says nothing about later ones
+                etag = response.headers.get("ETag")
+                with self._namespace_cache_lock:
+                    if etag and params["pageToken"] == "":
+                        self.namespace_cache[namespace] = {
+                            "etag": etag,
+                            "tables": [list(identifier) for identifier in page],
+                        }
+                    else:
+                        self.namespace_cache.pop(namespace, None)
+                return
+            params = {"pageToken": next_token, "pageSize": LIST_TABLES_PAGE_SIZE}
+
+    def refresh_token(self) -> bool:
+        """
+        Refresh the REST catalog's OAuth token through pyiceberg's own hook.
+        Returns False when this pyiceberg version has no such hook or the
+        refresh fails, so the caller falls back to catalog.list_tables.
+        """
+        refresh = getattr(self.catalog, "_refresh_token", None)
+        if refresh is None:
+            return False
+        try:
+            # Serialised: concurrent namespaces tend to see the expiry together
+            with self._token_lock:
+                refresh()
+            return True
+        except Exception as e:
+            logger.warning(f"Could not refresh catalog token: {e}")
+            return False
+
+    def save_caches(self):
+        with self._namespace_cache_lock:
+            namespace_snapshot = dict(self.namespace_cache)
+        write_json_cache(NAMESPACE_CACHE_PATH, "namespace cache", namespace_snapshot)
+        if REPLACE_ON_SYNC:
+            with self._replace_state_lock:
+                replace_snapshot = dict(self.replace_state)
+            write_json_cache(REPLACE_STATE_PATH, "replace state", replace_snapshot)
+        self.forget_refresh_state()
+
+    def forget_refresh_state(self):
+        """Drop the refresh script's entries for tables this run repointed."""
+        with self._repointed_lock:
+            repointed = set(self.repointed)
+        if not repointed or not REFRESH_STATE_PATH:
+            return
+        refresh_state = read_json_cache(REFRESH_STATE_PATH, "refresh state")
+        stale = repointed & refresh_state.keys()
+        if stale:
+            for full_table in stale:
+                del refresh_state[full_table]
+            write_json_cache(REFRESH_STATE_PATH, "refresh state", refresh_state)
+
+    def record_repointed(self, full_table: str):
+        with self._repointed_lock:
+            self.repointed.add(full_table)
+
+    def replaced_metadata_location(self, full_table: str) -> Optional[str]:
+        with self._replace_state_lock:
+            return self.replace_state.get(full_table)
+
+    def record_replaced(self, full_table: str, metadata_path: str):
+        if REPLACE_ON_SYNC:
+            with self._replace_state_lock:
+                self.replace_state[full_table] = metadata_path
+
+    def load_metadata_location(self, table_identifier: TableIdentifier) -> str:
+        """Load a table from Polaris and return its current metadata_location."""
+        self.connect_to_catalog()
+        table = self.catalog.load_table(table_identifier)
+        return get_metadata_path(table)
 
 # COMMAND ----------
 
@@ -111,6 +386,204 @@ def get_metadata_path(table) -> str:
         raise ValueError(f"No metadata location for {table.identifier}")
     return table.metadata_location
 
+def uc_table_name(namespace: str, table_identifier) -> str:
+    return f"{DBX_CATALOG_NAME}.`{namespace}`.`{table_identifier[-1]}`"
+
+def list_uc_tables(spark, namespace: str) -> Set[str]:
+    """
+    Lowercased names of the tables already registered in the namespace's
+    Unity Catalog schema. On failure the set is empty, so every table goes
+    through CREATE TABLE IF NOT EXISTS as before.
+    """
+    try:
+        rows = spark.sql(f"SHOW TABLES IN {DBX_CATALOG_NAME}.`{namespace}`").collect()
+        return {row.tableName.lower() for row in rows}
+    except Exception as e:
+        logger.warning(f"Could not list Unity Catalog tables in {namespace}: {e}")
+        return set()
+
+def record_created(reader: PolarisSQLReader, full_table: str, metadata_path: str):
+    """Bookkeeping after a CREATE succeeded for a table."""
+    reader.record_replaced(full_table, metadata_path)
+    # The table now has a pointer the refresh script's state doesn't know about
+    reader.record_repointed(full_table)
+
+def create_table_sql(full_table: str, metadata_path: str) -> str:
+    create = "CREATE OR REPLACE TABLE" if REPLACE_ON_SYNC else "CREATE TABLE IF NOT EXISTS"
+    return f"""
+        {create} {full_table}
+        UNIFORM ICEBERG
+        METADATA_PATH '{metadata_path}'
+        """
+
+def resolve_metadata_path(reader: PolarisSQLReader, namespace: str, table_identifier) -> Optional[str]:
+    """
+    Load the table from Polaris and return its current metadata_location.
+    Failures are logged and reported as None so one table doesn't stop the rest.
+    """
+    try:
+        return reader.load_metadata_location(table_identifier)
+    except Exception as e:
+        logger.error(
+            f"❌ Failed table {namespace}.{table_identifier[-1]}: {e}"
+        )
+        return None
+
+def create_table(spark, reader: PolarisSQLReader, namespace: str, table_identifier,
+                 metadata_path: str) -> bool:
+    """
+    Register a single table in Unity Catalog at its resolved metadata_path.
+    Failures are logged and reported as False so one table doesn't stop the rest.
+    """
+    table_name = table_identifier[-1]
+    full_table = uc_table_name(namespace, table_identifier)
+
+    try:
+        sql = create_table_sql(full_table, metadata_path)
+
+        logger.info(f"Creating table:\n{sql}")
+        spark.sql(sql)
+        record_created(reader, full_table, metadata_path)
+        logger.info(f"✅ Created table: {full_table}")
+        return True
+
+    except Exception as e:
+        logger.error(
+            f"❌ Failed table {namespace}.{table_name}: {e}"
+        )
+        return False
+
+# Set once a BEGIN ... END block is rejected as a whole (no SQL scripting on
+# this runtime), so later batches go straight to one statement per table
+_SCRIPTING_UNSUPPORTED = threading.Event()
+
+def is_scripting_unsupported(error: Exception) -> bool:
+    """True when a batch failed because the block itself can't run, not because of a table."""
+    message = str(error).upper()
+    return any(
+        marker in message
+        for marker in ("PARSE_SYNTAX_ERROR", "PARSEEXCEPTION", "SQL_SCRIPTING", "UNSUPPORTED", "NOT SUPPORTED")
+    )
+
+def create_tables_batch(spark, reader: PolarisSQLReader, namespace: str,
+                        batch: List[Tuple[TableIdentifier, str]]) -> int:
+    """
+    Register a batch of tables from one namespace in a single Unity Catalog
+    round-trip, using a SQL scripting block (BEGIN ... END).
+    If the block fails — a bad table, or a runtime without SQL scripting —
+    fall back to one statement per table; in the latter case batching is
+    turned off for the rest of the run. Returns the number of tables created.
+    """
+    if len(batch) > 1 and not _SCRIPTING_UNSUPPORTED.is_set():
+        statements = [
+            create_table_sql(uc_table_name(namespace, table_identifier), metadata_path)
+            .strip() + ";"
+            for table_identifier, metadata_path in batch
+        ]
+        try:
+            spark.sql("BEGIN\n" + "\n".join(statements) + "\nEND")
+            for table_identifier, metadata_path in batch:
+                record_created(reader, uc_table_name(namespace, table_identifier), metadata_path)
+            logger.info(f"✅ Created {len(batch)} tables in {namespace} in one batch")
+            return len(batch)
+        except Exception as e:
+            if is_scripting_unsupported(e):
+                if not _SCRIPTING_UNSUPPORTED.is_set():
+                    _SCRIPTING_UNSUPPORTED.set()
+                    logger.info(f"SQL scripting blocks not supported, creating tables one at a time: {e}")
+            else:
+                logger.info(
+                    f"Batch of {len(batch)} tables in {namespace} failed, "
+                    f"retrying one at a time: {e}"
+                )
+
+    return sum(
+        1 for table_identifier, metadata_path in batch
+        if create_table(spark, reader, namespace, table_identifier, metadata_path)
+    )
+
+def sync_namespace(spark, reader: PolarisSQLReader, namespace: str,
+                   table_executor: ThreadPoolExecutor) -> Optional[Tuple[int, int, int]]:
+    """
+    Create the Unity Catalog schema for a namespace, then stream its Polaris
+    tables through the shared table pool one listing page at a time: each
+    page's metadata paths are resolved concurrently and its CREATE TABLE
+    batches are submitted before the next page is fetched.
+    Tables already in Unity Catalog are skipped before any Polaris load, since
+    CREATE TABLE IF NOT EXISTS would do nothing for them; with REPLACE_ON_SYNC
+    only those already replaced to their current path are skipped.
+    Returns (created, skipped, listed), or None if the namespace failed; failures
+    are logged so one bad namespace is skipped without stopping the others.
+    """
+    logger.info(f"Processing namespace: {namespace}")
+
+    # 1. Create schema
+    try:
+        spark.sql(
+            f"CREATE SCHEMA IF NOT EXISTS {DBX_CATALOG_NAME}.`{namespace}`"
+        )
+    except Exception as e:
+        logger.error(f"❌ Failed creating schema {namespace}: {e}")
+        return None
+
+    existing = list_uc_tables(spark, namespace)
+
+    # 2. Stream tables page by page into the table pool
+    batch_size = max(DDL_BATCH_SIZE, 1)
+    batch_futures = []
+    listed = 0
+    skipped = 0
+    tables = reader.list_tables(namespace)
+    try:
+        while True:
+            page = list(islice(tables, LIST_TABLES_PAGE_SIZE))
+            if not page:
+                break
+            listed += len(page)
+            if not REPLACE_ON_SYNC:
+                pending = [
+                    table_identifier for table_identifier in page
+                    if table_identifier[-1].lower() not in existing
+                ]
+                skipped += len(page) - len(pending)
+                page = pending
+
+            path_futures = [
+                table_executor.submit(resolve_metadata_path, reader, namespace, table_identifier)
+                for table_identifier in page
+            ]
+            entries = [
+                (table_identifier, future.result())
+                for table_identifier, future in zip(page, path_futures)
+                if future.result() is not None
+            ]
+            if REPLACE_ON_SYNC:
+                # Still in Unity Catalog and already replaced to the current
+                # metadata path - nothing to do
+                pending = [
+                    (table_identifier, metadata_path)
+                    for table_identifier, metadata_path in entries
+                    if table_identifier[-1].lower() not in existing
+                    or reader.replaced_metadata_location(uc_table_name(namespace, table_identifier)) != metadata_path
+                ]
+                skipped += len(entries) - len(pending)
+                entries = pending
+            batch_futures.extend(
+                table_executor.submit(create_tables_batch, spark, reader, namespace, entries[i:i + batch_size])
+                for i in range(0, len(entries), batch_size)
+            )
+    except Exception as e:
+        logger.error(f"❌ Failed listing tables for {namespace}: {e}")
+        wait(batch_futures)
+        return None
+
+    created = sum(future.result() for future in batch_futures)
+    logger.info(
+        f"Namespace {namespace}: created {created}/{listed - skipped} tables"
+        + (f", {skipped} already up to date" if skipped else "")
+    )
+    return created, skipped, listed
+
 # COMMAND ----------
 
 # Databricks notebook source
@@ -132,54 +605,32 @@ def main():
         )
 
     reader = PolarisSQLReader()
+    # Connect once up front so worker threads share a single catalog client
+    reader.connect_to_catalog()
     namespaces = reader.list_namespaces()
+    if "atlan-history" in namespaces and not HISTORY_NAMESPACE_SYNC:
+        logger.info("Skipping atlan-history (flag disabled)")
+        namespaces = [ns for ns in namespaces if ns != "atlan-history"]
 
-    for namespace in namespaces:
-        if namespace == "atlan-history" and not HISTORY_NAMESPACE_SYNC:
-            logger.info("Skipping atlan-history (flag disabled)")
-            continue
-
-        logger.info(f"Processing namespace: {namespace}")
-
-        # 1. Create schema
-        try:
-            spark.sql(
-                f"CREATE SCHEMA IF NOT EXISTS {DBX_CATALOG_NAME}.`{namespace}`"
-            )
-        except Exception as e:
-            logger.error(f"❌ Failed creating schema {namespace}: {e}")
-            continue
-
-        # 2. Create tables
-        try:
-            tables = reader.list_tables(namespace)
-        except Exception as e:
-            logger.error(f"❌ Failed listing tables for {namespace}: {e}")
-            continue
-
-        for table_identifier in tables:
-            try:
-                table = reader.catalog.load_table(table_identifier)
-                metadata_path = get_metadata_path(table)
-                table_name = table_identifier[-1]
-
-                full_table = f"{DBX_CATALOG_NAME}.`{namespace}`.`{table_name}`"
-
-                sql = f"""
-                CREATE TABLE IF NOT EXISTS {full_table}
-                UNIFORM ICEBERG
-                METADATA_PATH '{metadata_path}'
-                """
-
-                logger.info(f"Creating table:\n{sql}")
-                spark.sql(sql)
-                logger.info(f"✅ Created table: {full_table}")
-
-            except Exception as e:
-                logger.error(
-                    f"❌ Failed table {namespace}.{table_identifier[-1]}: {e}"
-                )
-                continue
+    # Namespaces are synced concurrently and all feed one shared table pool,
+    # so Polaris loads and Unity Catalog DDLs stay bounded by
+    # MAX_CONCURRENT_TABLES however many namespaces are in flight
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TABLES) as table_executor, \
+            ThreadPoolExecutor(max_workers=MAX_CONCURRENT_NAMESPACES) as ns_executor:
+        ns_futures = [
+            ns_executor.submit(sync_namespace, spark, reader, namespace, table_executor)
+            for namespace in namespaces
+        ]
+        wait(ns_futures)
+    results = [future.result() for future in ns_futures if future.result() is not None]
+    skipped = sum(skipped for _, skipped, _ in results)
+    logger.info(
+        f"Created {sum(created for created, _, _ in results)}/"
+        f"{sum(listed for _, _, listed in results) - skipped} tables across "
+        f"{len(results)}/{len(namespaces)} namespaces"
+        + (f", {skipped} already up to date" if skipped else "")
+    )
+    reader.save_caches()
     logger.info("✅ Sync completed for all namespaces")
 
 # COMMAND ----------
@@ -1,10 +1,11 @@
 # Databricks notebook to rerfresh the MDLH catalog
 # MAGIC %pip install pyiceberg
 import os
+import json
 import logging
 import sys
-from typing import List, Tuple
-from pyiceberg.catalog import load_catalog
+from typing import Dict, List, Tuple
+from pyiceberg.catalog import Catalog, load_catalog
 from pyiceberg.table import TableIdentifier
 from pyspark.sql import SparkSession
 
@@ -35,39 +36,51 @@ DBX_CATALOG_NAME = os.getenv("DBX_CATALOG_NAME", "<target-dbx-catalog-name>")
 # default is Skipping atlan-history. please set to true to enable history tables sync
 HISTORY_NAMESPACE_SYNC = os.getenv("HISTORY_NAMESPACE_SYNC", "false").lower() == "true"
 
+# Metadata path each Unity Catalog table was last refreshed to. Tables whose Polaris
+# metadata_location still matches are skipped. Set to "" to always refresh
+REFRESH_STATE_PATH = os.getenv("MDLH_REFRESH_STATE_PATH", "/dbfs/tmp/mdlh_refresh_state.json")
+
 # COMMAND ----------
 
 # Databricks notebook source
 # -----------------------------
 # Polaris SQL Reader
 # -----------------------------
+def is_configured(value: str) -> bool:
+    """True when a config value was set, i.e. is not a <placeholder>."""
+    return bool(value) and not value.startswith("<")
+
+def load_polaris_catalog(catalog_name: str, warehouse_name: str) -> Catalog:
+    return load_catalog(
+        catalog_name,
+        uri=POLARIS_CATALOG_URI,
+        warehouse=warehouse_name,
+        credential=f"{CLIENT_ID}:{CLIENT_SECRET}",
+        scope="PRINCIPAL_ROLE:ALL"
+    )
+
 class PolarisSQLReader:
     def __init__(self):
         self.catalog = None
         self.catalog_name = None
         self.warehouse_name = None
 
-    def detect_catalog(self) -> Tuple[str, str]:
+    def detect_catalog(self) -> Tuple[str, Catalog]:
         """
         Detect catalog and warehouse dynamically.
         Prefer 'atlan-wh', fallback to 'context_store'.
+        Returns the probed catalog so it doesn't have to be loaded twice.
         """
         logger.info("Detecting Polaris catalog...")
 
         errors = {}
         for candidate in ["atlan-wh", "context_store"]:
             try:
-                test_catalog = load_catalog(
-                    candidate,
-                    uri=POLARIS_CATALOG_URI,
-                    warehouse=candidate,
-                    credential=f"{CLIENT_ID}:{CLIENT_SECRET}",
-                    scope="PRINCIPAL_ROLE:ALL"
-                )
+                test_catalog = load_polaris_catalog(candidate, candidate)
                 namespaces = test_catalog.list_namespaces()
                 if namespaces:
                     logger.info(f"Using catalog: {candidate}")
-                    return candidate, candidate
+                    return candidate, test_catalog
             except Exception as e:
                 errors[candidate] = e
                 logger.info(f"Catalog not accessible: {candidate}")
@@ -79,15 +92,19 @@ class PolarisSQLReader:
         raise RuntimeError("No valid Polaris catalog found")
 
     def connect_to_catalog(self):
+        """
+        Connect on first use. When CATALOG_NAME is configured, detection (and
+        its probe round-trip) is skipped; WAREHOUSE_NAME defaults to the
+        catalog name.
+        """
         if not self.catalog:
-            self.catalog_name, self.warehouse_name = self.detect_catalog()
-            self.catalog = load_catalog(
-                self.catalog_name,
-                uri=POLARIS_CATALOG_URI,
-                warehouse=self.warehouse_name,
-                credential=f"{CLIENT_ID}:{CLIENT_SECRET}",
-                scope="PRINCIPAL_ROLE:ALL"
-            )
+            if is_configured(CATALOG_NAME):
+                self.catalog_name = CATALOG_NAME
+                self.warehouse_name = WAREHOUSE_NAME if is_configured(WAREHOUSE_NAME) else CATALOG_NAME
+                self.catalog = load_polaris_catalog(self.catalog_name, self.warehouse_name)
+            else:
+                self.catalog_name, self.catalog = self.detect_catalog()
+                self.warehouse_name = self.catalog_name
             logger.info(f"Connected to Polaris catalog: {self.catalog_name}")
 
     def list_namespaces(self) -> List[str]:
@@ -111,6 +128,33 @@ def get_metadata_path(table) -> str:
         raise ValueError(f"No metadata location for {table.identifier}")
     return table.metadata_location
 
+def load_refresh_state() -> Dict[str, str]:
+    """
+    Read the Unity Catalog table -> last refreshed metadata path map from the
+    previous run.
+    A missing or unreadable file just means every table is refreshed.
+    """
+    if not REFRESH_STATE_PATH:
+        return {}
+    try:
+        with open(REFRESH_STATE_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable refresh state {REFRESH_STATE_PATH}: {e}")
+        return {}
+
+def save_refresh_state(state: Dict[str, str]):
+    if not REFRESH_STATE_PATH:
+        return
+    try:
+        os.makedirs(os.path.dirname(REFRESH_STATE_PATH), exist_ok=True)
+        with open(REFRESH_STATE_PATH, "w") as f:
+            json.dump(state, f)
+    except Exception as e:
+        logger.warning(f"Could not save refresh state {REFRESH_STATE_PATH}: {e}")
+
 # COMMAND ----------
 
 # Databricks notebook source
@@ -133,6 +177,8 @@ def main():
 
     reader = PolarisSQLReader()
     namespaces = reader.list_namespaces()
+    refresh_state = load_refresh_state()
+    skipped = 0
 
     for namespace in namespaces:
         if namespace == "atlan-history" and not HISTORY_NAMESPACE_SYNC:
@@ -165,6 +211,14 @@ def main():
 
                 full_table = f"{DBX_CATALOG_NAME}.`{namespace}`.`{table_name}`"
 
+                # Nothing changed upstream since the last refresh. Keyed by
+                # the Unity Catalog table, so a new DBX_CATALOG_NAME starts
+                # fresh; the create script drops entries for tables it creates
+                if refresh_state.get(full_table) == metadata_path:
+                    logger.info(f"⏭️ Skipped table (metadata unchanged): {full_table}")
+                    skipped += 1
+                    continue
+
                 sql = f"""
                 REFRESH TABLE {full_table}
                 METADATA_PATH '{metadata_path}'
@@ -173,12 +227,15 @@ def main():
                 logger.info(f"Refresh table:\n{sql}")
                 spark.sql(sql)
                 logger.info(f"✅ Refreshed table: {full_table}")
+                refresh_state[full_table] = metadata_path
 
             except Exception as e:
                 logger.error(
                     f"❌ Failed table {namespace}.{table_identifier[-1]}: {e}"
                 )
                 continue
+    save_refresh_state(refresh_state)
+    logger.info(f"Skipped {skipped} tables whose metadata was unchanged")
     logger.info("✅ Refresh completed for all namespaces")
 
 # COMMAND ----------
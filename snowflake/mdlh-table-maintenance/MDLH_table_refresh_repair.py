@@ -6,10 +6,13 @@ Identifies MDLH Iceberg tables whose auto-refresh has stopped working
 
 import json
 import re
+import time
+from functools import lru_cache
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import streamlit as st
 import pandas as pd
-from typing import List, Dict, Tuple
+from typing import List, Dict, Optional, Tuple
 
 # ============================================================================
 # Configuration
@@ -30,7 +33,12 @@ def initialize_session_state():
         st.session_state.stale_tables = []
     if 'repair_results' not in st.session_state:
         st.session_state.repair_results = []
+    if 'repair_cancelled' not in st.session_state:
+        st.session_state.repair_cancelled = False
+    if 'table_list_generations' not in st.session_state:
+        st.session_state.table_list_generations = {}
 
+@lru_cache(maxsize=8192)
 def quote_ident(name: str) -> str:
     """Quote a Snowflake identifier, escaping embedded double quotes."""
     return '"' + name.replace('"', '""') + '"'
@@ -57,89 +65,140 @@ def get_snowflake_connection():
     st.info("This app must be deployed as a native Snowflake Streamlit app to work properly.")
     return None
 
-def execute_query(conn, query: str) -> List[Tuple]:
-    """Execute a SQL query and return results."""
-    try:
-        result = conn.sql(query).collect()
-        return [tuple(row) for row in result]
-    except Exception as e:
-        st.error(f"Query execution error: {str(e)}")
-        raise
+@st.cache_data(ttl=300, show_spinner=False)
+def list_schemas(_conn, database: str) -> List[str]:
+    """List all schemas in a database, cached for five minutes per database.
 
-def list_schemas(conn, database: str) -> List[str]:
-    """List all schemas in a database."""
-    try:
-        # Use INFORMATION_SCHEMA to get exact schema names (case-sensitive)
-        query = f"""
-        SELECT DISTINCT SCHEMA_NAME
-        FROM {quote_ident(database)}.INFORMATION_SCHEMA.SCHEMATA
-        WHERE SCHEMA_NAME <> 'INFORMATION_SCHEMA'
-        ORDER BY SCHEMA_NAME
-        """
-        results = execute_query(conn, query)
-        
-        # Extract schema names from results
-        schemas = []
-        for row in results:
-            schemas.append(str(row[0]))  # SCHEMA_NAME column
-        
-        return schemas
-    except Exception as e:
-        st.error(f"Error listing schemas: {str(e)}")
-        return []
+    Errors propagate (and so are not cached) — the caller reports them.
+    """
+    # SHOW SCHEMAS is served by the metadata service, so unlike
+    # INFORMATION_SCHEMA.SCHEMATA it needs no warehouse or query compile.
+    # Names come back exactly as stored (case-sensitive)
+    rows = _conn.sql(f"SHOW SCHEMAS IN DATABASE {quote_ident(database)}").collect()
+    return sorted(
+        str(row['name']) for row in rows
+        if row['name'] != 'INFORMATION_SCHEMA'
+    )
 
-def list_iceberg_tables(conn, database: str, schema: str, days_threshold: int) -> List[Dict]:
-    """List every Iceberg table in a schema, with a LAST_ALTERED staleness flag."""
+def parse_auto_refresh(value) -> Optional[bool]:
+    """An AUTO_REFRESH value as a bool, or None if it isn't a plain on/off flag."""
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in ('true', 'on', 'yes', 'enabled'):
+        return True
+    if text in ('false', 'off', 'no', 'disabled'):
+        return False
+    return None
+
+def list_auto_refresh_flags(conn, database: str, schema: str) -> Dict[str, Optional[bool]]:
+    """Map table name -> AUTO_REFRESH setting, from SHOW ICEBERG TABLES.
+
+    SHOW is served by the metadata service, so this is one cheap call for the
+    whole schema. The column is looked up as auto_refresh_status, then
+    auto_refresh, rather than assumed. Returns {} if the command fails or
+    neither column is present, and None for values that aren't a plain
+    on/off flag; callers then treat the setting as unknown and check those
+    tables' status instead.
+    """
     try:
-        # Use exact schema name match (case-sensitive) as in direct SQL query
-        # Escape single quotes in schema name if present
-        schema_escaped = schema.replace("'", "''")
+        rows = conn.sql(
+            f"SHOW ICEBERG TABLES IN SCHEMA {quote_ident(database)}.{quote_ident(schema)}"
+        ).collect()
+    except Exception:
+        return {}
+    if not rows:
+        return {}
+    columns = rows[0].as_dict()
+    column = next((c for c in ('auto_refresh_status', 'auto_refresh') if c in columns), None)
+    if column is None:
+        return {}
+    return {str(row['name']): parse_auto_refresh(row[column]) for row in rows}
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def list_iceberg_tables(_conn, database: str, schema: str, days_threshold: int,
+                        generation: int = 0) -> Tuple[float, pd.DataFrame]:
+    """List every Iceberg table in a schema, with a LAST_ALTERED staleness flag.
+
+    Cached per (database, schema, days_threshold) and returned with the time
+    it was fetched; use get_iceberg_tables() to apply the TTL. generation only
+    takes part in the cache key, so an expired listing can be re-queried.
+    Errors propagate uncached.
+    """
+    # Schema name and threshold are bind variables: no quoting to get wrong,
+    # and the query text stays the same across schemas/thresholds so
+    # Snowflake can reuse the compiled plan. The database is an identifier
+    # and can't be bound, so it is quoted instead.
+    # Only Iceberg tables can be repaired with ALTER ICEBERG TABLE; an empty
+    # stale table is still worth repairing, so no ROW_COUNT filter
+    query = f"""
+    SELECT
+        TABLE_NAME,
+        LAST_ALTERED,
+        ROW_COUNT,
+        LAST_ALTERED < DATEADD(day, ?, CURRENT_TIMESTAMP()) AS TIME_STALE
+    FROM {quote_ident(database)}.INFORMATION_SCHEMA.TABLES
+    WHERE TABLE_SCHEMA = ?
+      AND IS_ICEBERG = 'YES'
+    ORDER BY LAST_ALTERED ASC
+    """
 
-        # Only Iceberg tables can be repaired with ALTER ICEBERG TABLE; an empty
-        # stale table is still worth repairing, so no ROW_COUNT filter
-        query = f"""
-        SELECT
-            TABLE_NAME,
-            LAST_ALTERED,
-            ROW_COUNT,
-            LAST_ALTERED < DATEADD(day, -{int(days_threshold)}, CURRENT_TIMESTAMP()) AS TIME_STALE
-        FROM {quote_ident(database)}.INFORMATION_SCHEMA.TABLES
-        WHERE TABLE_SCHEMA = '{schema_escaped}'
-          AND IS_ICEBERG = 'YES'
-        ORDER BY LAST_ALTERED ASC
-        """
-
-        results = execute_query(conn, query)
-
-        return [
-            {
-                'table_name': row[0],
-                'last_altered': row[1],
-                'row_count': row[2],
-                'time_stale': bool(row[3]),
-                'database': database,
-                'schema': schema,
-            }
-            for row in results
-        ]
-    except Exception as e:
-        st.error(f"Error listing Iceberg tables: {str(e)}")
-        return []
+    # to_pandas builds the DataFrame from Arrow result batches, skipping
+    # a Python tuple per row
+    df = _conn.sql(query, params=[-int(days_threshold), schema]).to_pandas()
+    df.columns = [c.lower() for c in df.columns]
+    # Normalise LAST_ALTERED to naive UTC once here, so the display code can
+    # do date arithmetic without converting again
+    df['last_altered'] = pd.to_datetime(df['last_altered'], utc=True).dt.tz_localize(None)
+    df['time_stale'] = df['time_stale'].fillna(False).astype(bool)
+    df['database'] = database
+    df['schema'] = schema
+    # True/False per table, or missing when SHOW ICEBERG TABLES couldn't say
+    df['auto_refresh'] = df['table_name'].map(list_auto_refresh_flags(_conn, database, schema))
+    # Quote every name once, vectorised; everything downstream uses fq_name
+    df['fq_name'] = (
+        f'{quote_ident(database)}.{quote_ident(schema)}."'
+        + df['table_name'].astype(str).str.replace('"', '""', regex=False) + '"'
+    )
+    return time.time(), df
 
-def check_auto_refresh_status(conn, database: str, schema: str, table_name: str) -> Dict:
+def get_iceberg_tables(conn, database: str, schema: str, days_threshold: int,
+                       ttl_seconds: int) -> pd.DataFrame:
+    """A schema's Iceberg table listing, re-queried once older than ttl_seconds.
+
+    st.cache_data fixes its ttl when the decorator is applied, so the
+    adjustable TTL is enforced here from the fetch time instead: an expired
+    listing moves this session to the next generation of the cache key.
+    """
+    key = (database, schema, int(days_threshold))
+    generations = st.session_state.table_list_generations
+    started = time.time()
+    while True:
+        fetched_at, df = list_iceberg_tables(conn, *key, generations.get(key, 0))
+        # A listing fetched by this call is returned even if the query
+        # itself took longer than the TTL
+        if fetched_at >= started or time.time() - fetched_at <= ttl_seconds:
+            return df
+        # Another session may already hold the next generation; if that one
+        # has expired too, keep going until a fresh listing is fetched
+        generations[key] = generations.get(key, 0) + 1
+
+def clear_metadata_caches():
+    """Drop cached schema and table listings so the next lookup re-queries."""
+    list_schemas.clear()
+    list_iceberg_tables.clear()
+
+def check_auto_refresh_status(conn, fq_name: str) -> Dict:
     """Check SYSTEM$AUTO_REFRESH_STATUS for a table — the authoritative signal.
 
     Auto-refresh is broken when executionState is anything other than RUNNING
     or when a failure/error/invalid field is populated. A table whose status
     can't be read is reported as broken so it isn't silently skipped.
     """
-    fqn = f'{quote_ident(database)}.{quote_ident(schema)}.{quote_ident(table_name)}'
-    fqn_literal = fqn.replace("'", "''")
-    query = f"SELECT SYSTEM$AUTO_REFRESH_STATUS('{fqn_literal}')"
     try:
         # Quiet path (no st.error): a per-table failure belongs in the results
         # table, not as a page-level error banner for each of N tables
-        rows = conn.sql(query).collect()
+        rows = conn.sql("SELECT SYSTEM$AUTO_REFRESH_STATUS(?)", params=[fq_name]).collect()
         raw = str(rows[0][0])
     except Exception as e:
         return {'state': 'CHECK_FAILED', 'broken': True, 'detail': str(e)}
@@ -157,20 +216,34 @@ def check_auto_refresh_status(conn, database: str, schema: str, table_name: str)
     return {'state': state, 'broken': state != 'RUNNING' or bool(errors), 'detail': detail}
 
 def find_problem_tables(conn, database: str, schema: str, days_threshold: int,
-                        use_threshold: bool, on_progress=None) -> List[Dict]:
+                        use_threshold: bool, on_progress=None, cache_ttl: int = 60) -> List[Dict]:
     """Scan a schema and flag tables whose auto-refresh is broken.
 
     SYSTEM$AUTO_REFRESH_STATUS is authoritative. When use_threshold is set,
     tables that are merely stale by LAST_ALTERED are merged in and labelled,
     so healthy-but-quiet tables are distinguishable from broken ones.
+    Tables with AUTO_REFRESH = FALSE are broken by definition, so they are
+    flagged without the per-table status call.
     """
-    tables = list_iceberg_tables(conn, database, schema, days_threshold)
+    try:
+        tables = get_iceberg_tables(conn, database, schema, days_threshold, cache_ttl)
+    except Exception as e:
+        st.error(f"Error listing Iceberg tables: {str(e)}")
+        return []
     flagged = []
     total = len(tables)
-    for idx, table in enumerate(tables):
+    if total and tables['auto_refresh'].isna().all():
+        st.caption(
+            "AUTO_REFRESH flags were unavailable from SHOW ICEBERG TABLES, "
+            "so every table's status was checked."
+        )
+    for idx, table in enumerate(tables.to_dict('records')):
         if on_progress:
             on_progress(idx + 1, total, table['table_name'])
-        status = check_auto_refresh_status(conn, database, schema, table['table_name'])
+        if pd.notna(table['auto_refresh']) and not table['auto_refresh']:
+            status = {'state': 'DISABLED', 'broken': True, 'detail': 'AUTO_REFRESH = FALSE'}
+        else:
+            status = check_auto_refresh_status(conn, table['fq_name'])
         time_stale = use_threshold and table['time_stale']
         if status['broken'] and time_stale:
             flagged_by = 'Status + threshold'
@@ -189,38 +262,92 @@ def find_problem_tables(conn, database: str, schema: str, days_threshold: int,
         })
     return flagged
 
-def repair_statements(database: str, schema: str, table_name: str) -> Tuple[str, str, str]:
-    """Build the repair statements for a table.
+def repair_statements(fq_name: str) -> Tuple[str, str, str]:
+    """Build the repair statements for a table, given its quoted fq_name.
 
     Manual REFRESH is rejected while AUTO_REFRESH = TRUE, so auto-refresh
     must be disabled first, then re-enabled after the manual refresh.
     """
-    fqn = f'{quote_ident(database)}.{quote_ident(schema)}.{quote_ident(table_name)}'
     return (
-        f'ALTER ICEBERG TABLE {fqn} SET AUTO_REFRESH = FALSE',
-        f'ALTER ICEBERG TABLE {fqn} REFRESH',
-        f'ALTER ICEBERG TABLE {fqn} SET AUTO_REFRESH = TRUE',
+        f'ALTER ICEBERG TABLE {fq_name} SET AUTO_REFRESH = FALSE',
+        f'ALTER ICEBERG TABLE {fq_name} REFRESH',
+        f'ALTER ICEBERG TABLE {fq_name} SET AUTO_REFRESH = TRUE',
+    )
+
+def repair_block(disable_stmt: str, refresh_stmt: str, enable_stmt: str) -> str:
+    """Snowflake Scripting block running the repair statements in order.
+
+    The block returns 'OK', or 'FAILED:<step>:<error>' naming the statement
+    (1-3) that failed, so the caller only re-runs what didn't happen.
+    """
+    return (
+        "DECLARE\n"
+        "  step INTEGER DEFAULT 0;\n"
+        "BEGIN\n"
+        f"  step := 1;\n  {disable_stmt};\n"
+        f"  step := 2;\n  {refresh_stmt};\n"
+        f"  step := 3;\n  {enable_stmt};\n"
+        "  RETURN 'OK';\n"
+        "EXCEPTION\n"
+        "  WHEN OTHER THEN\n"
+        "    RETURN 'FAILED:' || step || ':' || SQLERRM;\n"
+        "END;"
     )
 
-def repair_table(conn, database: str, schema: str, table_name: str) -> Tuple[bool, str]:
-    """Repair a single table by refreshing it and enabling auto-refresh."""
-    disable_stmt, refresh_stmt, enable_stmt = repair_statements(database, schema, table_name)
+def repair_table(conn, fq_name: str) -> Tuple[bool, str]:
+    """Repair a single table by refreshing it and enabling auto-refresh.
+
+    Runs on a worker thread, so it must not call st.* — errors are returned
+    and shown in the results table instead.
+
+    The statements are sent as one Snowflake Scripting block (one round-trip).
+    If re-enabling auto-refresh failed, only that step is retried, so the
+    (expensive) REFRESH never runs twice. Otherwise the statements are re-run
+    one at a time so the failing step is reported and auto-refresh is not
+    left disabled.
+    """
+    disable_stmt, refresh_stmt, enable_stmt = repair_statements(fq_name)
+    block_error = None
+    try:
+        rows = conn.sql(repair_block(disable_stmt, refresh_stmt, enable_stmt)).collect()
+        result = str(rows[0][0])
+    except Exception as e:
+        # The block itself couldn't run; nothing is known about the steps
+        block_error = e
+        result = 'FAILED:0:'
+    if result == 'OK':
+        return True, "Success"
+    failed_step = result.split(':', 2)[1]
+
+    if failed_step == '3':
+        try:
+            conn.sql(enable_stmt).collect()
+        except Exception as e:
+            return False, (
+                f"Refresh succeeded but auto-refresh could not be re-enabled: {e} "
+                f"(run {enable_stmt} manually)"
+            )
+        return True, "Success"
+
     try:
-        execute_query(conn, disable_stmt)
-        execute_query(conn, refresh_stmt)
+        conn.sql(disable_stmt).collect()
+        conn.sql(refresh_stmt).collect()
     except Exception as e:
+        message = str(e)
+        if block_error is not None:
+            message += f" (scripting block also failed: {block_error})"
         # Don't leave the table with auto-refresh explicitly disabled — before
         # the repair it was merely suspended, which is a less-broken state
         try:
-            execute_query(conn, enable_stmt)
+            conn.sql(enable_stmt).collect()
         except Exception:
             return False, (
-                f"{e} (auto-refresh could not be re-enabled — run "
+                f"{message} (auto-refresh could not be re-enabled — run "
                 f"{enable_stmt} manually)"
             )
-        return False, str(e)
+        return False, message
     try:
-        execute_query(conn, enable_stmt)
+        conn.sql(enable_stmt).collect()
     except Exception as e:
         return False, (
             f"Refresh succeeded but auto-refresh could not be re-enabled: {e} "
@@ -267,6 +394,25 @@ def main():
             """)
         return
     
+    # Cache controls: table listings are reused across reruns for this long
+    with st.sidebar:
+        st.subheader("Metadata Cache")
+        table_cache_ttl = st.number_input(
+            "Table list cache TTL (seconds)",
+            min_value=1,
+            max_value=3600,
+            value=60,
+            help="How long a schema's Iceberg table listing is reused before it is "
+                 "queried again. Auto-refresh status is always checked live",
+            key="table_cache_ttl"
+        )
+        st.button(
+            "Refresh now",
+            key="clear_cache_btn",
+            help="Forget cached schema and table listings",
+            on_click=clear_metadata_caches
+        )
+
     # Database and Schema Selection
     st.header("Select Database & Schema")
     
@@ -357,7 +503,8 @@ def main():
                 selected_schema,
                 days_threshold,
                 use_threshold,
-                _on_progress
+                _on_progress,
+                table_cache_ttl
             )
             progress_bar.empty()
             progress_text.empty()
@@ -368,6 +515,7 @@ def main():
                 t['table_name'] for t in flagged_tables if t['broken']
             ]
             st.session_state.repair_results = []
+            st.session_state.repair_cancelled = False
 
             broken_count = sum(1 for t in flagged_tables if t['broken'])
             threshold_only_count = len(flagged_tables) - broken_count
@@ -390,51 +538,39 @@ def main():
             st.header("Flagged Tables")
             
             # Create DataFrame for display
+            # last_altered is already naive UTC (see list_iceberg_tables)
             df_stale = pd.DataFrame(st.session_state.stale_tables)
-            df_stale['last_altered'] = pd.to_datetime(df_stale['last_altered'])
-            
-            # Handle timezone-aware vs timezone-naive datetime
-            # Convert timezone-aware datetimes to UTC, then remove timezone for consistent calculation
-            if df_stale['last_altered'].dt.tz is not None:
-                # Convert to UTC and remove timezone info
-                df_stale['last_altered'] = df_stale['last_altered'].dt.tz_convert('UTC').dt.tz_localize(None)
-            
-            # Use pd.Timestamp.now() in UTC, then remove timezone for calculation
             now = pd.Timestamp.now(tz='UTC').tz_localize(None)
-            
-            # Calculate days since refresh
             df_stale['days_since_refresh'] = (now - df_stale['last_altered']).dt.days
-            df_stale['last_altered_formatted'] = df_stale['last_altered'].dt.strftime('%Y-%m-%d %H:%M:%S')
-            
+
             # Display table
             st.markdown(f"""
             **{len(df_stale)} table(s) flagged — the 'Flagged By' column shows why each one is listed:**
             """)
 
-            # Broken tables first, then by how long since the last alteration
+            # Broken tables first, then by how long since the last alteration.
+            # 'broken' comes from the status checks, so this can't be pushed
+            # into the listing query's ORDER BY
             df_stale = df_stale.sort_values(
                 ['broken', 'days_since_refresh'], ascending=[False, False]
             )
 
-            # Format for display
-            display_df = df_stale[[
-                'table_name',
-                'flagged_by',
-                'execution_state',
-                'status_detail',
-                'last_altered_formatted',
-                'days_since_refresh',
-                'row_count'
-            ]].copy()
-            display_df['row_count'] = display_df['row_count'].fillna(0).astype(int)
-            display_df.columns = [
-                'Table Name', 'Flagged By', 'Refresh State', 'Status Detail',
-                'Last Altered', 'Days Since Altered', 'Row Count'
-            ]
-            display_df = display_df.reset_index(drop=True)  # Remove index column
-
-            # Use st.table which doesn't show index
-            st.table(display_df)
+            # Build the display frame straight from the columns it needs;
+            # flooring to seconds and casting to str formats the timestamps
+            # in one vectorised pass instead of strftime per row
+            display_df = pd.DataFrame({
+                'Table Name': df_stale['table_name'],
+                'Flagged By': df_stale['flagged_by'],
+                'Refresh State': df_stale['execution_state'],
+                'Status Detail': df_stale['status_detail'],
+                'Last Altered': df_stale['last_altered'].dt.floor('s').astype(str),
+                'Days Since Altered': df_stale['days_since_refresh'],
+                'Row Count': df_stale['row_count'].fillna(0).astype(int),
+            })
+
+            # st.dataframe virtualises rows, so long lists don't render every
+            # row as HTML on each rerun
+            st.dataframe(display_df, use_container_width=True, hide_index=True)
 
             # Summary statistics
             col1, col2, col3, col4 = st.columns(4)
@@ -490,51 +626,122 @@ def main():
             if selected_tables:
                 st.info(f"{len(selected_tables)} table(s) selected for repair")
                 
+                # Names quoted at scan time, so the repair targets the scanned schema
+                fq_names = dict(zip(df_stale['table_name'], df_stale['fq_name']))
+
                 # Show what will be executed (same statements repair_table runs)
                 with st.expander("Preview SQL Commands", expanded=False):
                     st.markdown("**The following commands will be executed for each selected table:**")
-                    for table_name in selected_tables:
-                        statements = ";\n".join(
-                            repair_statements(database_name, selected_schema, table_name)
-                        )
-                        st.code(f"""
--- For table: {table_name}
-{statements};
-                        """)
+                    st.code("\n\n".join([
+                        f"-- For table: {table_name}\n"
+                        + ";\n".join(repair_statements(fq_names[table_name])) + ";"
+                        for table_name in selected_tables
+                    ]), language="sql")
                 
+                repair_concurrency = st.number_input(
+                    "Parallel Repairs",
+                    min_value=1,
+                    max_value=32,
+                    value=16,
+                    help="Number of tables repaired at the same time. Each REFRESH waits "
+                         "on object storage, so running several at once is much faster",
+                    key="repair_concurrency"
+                )
+
+                def _cancel_repair():
+                    st.session_state.repair_cancelled = True
+
                 # Repair button
                 if st.button("Repair Selected Tables", type="primary", key="repair_btn"):
-                    repair_results = []
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
+                    # Clicking Cancel triggers a rerun, which interrupts this
+                    # loop at its next st.* call; the finally block below then
+                    # drops every repair that hasn't started yet
+                    st.button(
+                        "Cancel Repair",
+                        key="cancel_repair_btn",
+                        help="Skip tables not yet started; repairs already running finish",
+                        on_click=_cancel_repair
+                    )
+                    st.session_state.repair_cancelled = False
+                    st.session_state.repair_results = []
 
                     total_tables = len(selected_tables)
+                    outcomes = {}
 
-                    for idx, table_name in enumerate(selected_tables):
-                        status_text.text(f"Processing {idx + 1}/{total_tables}: {table_name}...")
-
-                        success, message = repair_table(
-                            conn,
-                            database_name,
-                            selected_schema,
-                            table_name
-                        )
-
-                        repair_results.append({
-                            'table_name': table_name,
-                            'success': success,
-                            'message': message
-                        })
-
-                        progress_bar.progress((idx + 1) / total_tables)
-
-                    progress_bar.empty()
-                    status_text.empty()
-
-                    st.session_state.repair_results = repair_results
+                    # Snowpark sessions accept concurrent queries; the UI is
+                    # only updated from this thread as repairs complete
+                    executor = ThreadPoolExecutor(
+                        max_workers=min(int(repair_concurrency), total_tables)
+                    )
+                    futures = {
+                        executor.submit(
+                            repair_table, conn, fq_names[table_name]
+                        ): table_name
+                        for table_name in selected_tables
+                    }
+                    try:
+                        with st.status(f"Repairing {total_tables} table(s)...", expanded=True) as status:
+                            progress_bar = st.progress(0)
+                            started = time.time()
+                            pending = set(futures)
+                            shown_label = None
+                            while pending:
+                                # Short poll rather than blocking on the next
+                                # result, so a Cancel click is picked up promptly
+                                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                                if finished:
+                                    for future in finished:
+                                        outcomes[futures[future]] = future.result()
+                                    # Stored as we go so a cancelled run keeps
+                                    # its results; selection order, not completion
+                                    st.session_state.repair_results = [
+                                        {
+                                            'table_name': table_name,
+                                            'success': outcomes[table_name][0],
+                                            'message': outcomes[table_name][1]
+                                        }
+                                        for table_name in selected_tables
+                                        if table_name in outcomes
+                                    ]
+                                    progress_bar.progress(len(outcomes) / total_tables)
+                                # Only send a delta when the count or the
+                                # whole-second elapsed time actually changed
+                                label = (
+                                    f"Repairing... {len(outcomes)}/{total_tables} done "
+                                    f"({time.time() - started:.0f}s)"
+                                )
+                                if label != shown_label:
+                                    status.update(label=label)
+                                    shown_label = label
+                            failed = sum(1 for success, _ in outcomes.values() if not success)
+                            if failed:
+                                status.update(
+                                    label=f"Repaired {total_tables - failed}, failed {failed}",
+                                    state="error",
+                                    expanded=False
+                                )
+                            else:
+                                status.update(
+                                    label=f"Repaired {total_tables} table(s)",
+                                    state="complete",
+                                    expanded=False
+                                )
+                    finally:
+                        for future in futures:
+                            future.cancel()
+                        executor.shutdown(wait=False)
+                        # Repaired tables have a new LAST_ALTERED; don't serve the old listing
+                        list_iceberg_tables.clear()
             else:
                 st.info("Select tables from the list above to repair them")
 
+            if st.session_state.repair_cancelled:
+                st.warning(
+                    "Repair cancelled. Tables that had not started were skipped; repairs "
+                    "already running finished in the background and are not listed "
+                    "below — scan again to see their current state."
+                )
+
             # Rendered from session state so results survive widget interactions
             if st.session_state.repair_results:
                 st.divider()
@@ -550,16 +757,12 @@ def main():
                     st.error(f"Failed to repair {failure_count} table(s)")
 
                 # Results table
-                results_display = df_results.copy()
-                results_display['status'] = results_display['success'].apply(
-                    lambda x: 'Success' if x else 'Failed'
-                )
-                results_display = results_display[['table_name', 'status', 'message']]
-                results_display.columns = ['Table Name', 'Status', 'Message']
-                results_display = results_display.reset_index(drop=True)  # Remove index column
-
-                # Use st.table instead of st.dataframe to avoid showing index
-                st.table(results_display)
+                results_display = pd.DataFrame({
+                    'Table Name': df_results['table_name'],
+                    'Status': df_results['success'].map({True: 'Success', False: 'Failed'}),
+                    'Message': df_results['message'],
+                })
+                st.dataframe(results_display, use_container_width=True, hide_index=True)
 
                 # Show failed tables details
                 failed_tables = df_results[~df_results['success']]
@@ -570,7 +773,7 @@ def main():
                             st.error(f"Error: {row['message']}")
 
                 # Success message
-                if failure_count == 0:
+                if failure_count == 0 and not st.session_state.repair_cancelled:
                     st.success("""
                     **All selected tables have been successfully repaired!**
 
@@ -588,7 +791,9 @@ def main():
 
         1. **Finds Broken Tables**:
            - Queries `INFORMATION_SCHEMA.TABLES` to find every Iceberg table in the schema
-           - Checks `SYSTEM$AUTO_REFRESH_STATUS` on each one — the authoritative signal;
+           - Reads each table's `AUTO_REFRESH` setting with one `SHOW ICEBERG TABLES`;
+             tables with it turned off are flagged as `DISABLED` straight away
+           - Checks `SYSTEM$AUTO_REFRESH_STATUS` on the rest — the authoritative signal;
              any `executionState` other than `RUNNING` (or a populated failure field)
              means auto-refresh is broken
            - Optionally also flags tables whose `LAST_ALTERED` is older than N days;
@@ -599,7 +804,8 @@ def main():
            - Disables auto-refresh (manual refresh is rejected while it is enabled)
            - Runs `ALTER ICEBERG TABLE <db>.<schema>.<table> REFRESH` to refresh metadata
            - Runs `ALTER ICEBERG TABLE <db>.<schema>.<table> SET AUTO_REFRESH = TRUE` to re-enable auto-refresh
-           - Processes tables one by one and shows progress
+           - Repairs several tables in parallel (see 'Parallel Repairs') and shows progress
+           - 'Cancel Repair' skips tables that haven't started yet
         
         3. **Results**:
            - Shows success/failure status for each table
@@ -625,7 +831,7 @@ def main():
         SELECT SYSTEM$AUTO_REFRESH_STATUS('<database>."<schema>"."<table>"');
         ```
         
-        **Repair Each Table:**
+        **Repair Each Table** (sent as one `BEGIN ... END` block):
         ```sql
         ALTER ICEBERG TABLE <database>.<schema>.<table> SET AUTO_REFRESH = FALSE;
         ALTER ICEBERG TABLE <database>.<schema>.<table> REFRESH;